@@ -0,0 +1 @@
+# Root conftest so the crawlers/ packages are importable from tests/.
@@ -0,0 +1,76 @@
+"""Demo records for the Companies House officer pipeline.
+
+Produces a small sample output file in the same shape as real crawler
+results, for wiring up downstream consumers without hitting the site.
+"""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+# One timestamp for the whole demo batch — the records are "scraped"
+# together, and utcnow() is deprecated anyway.
+now = datetime.now(timezone.utc).isoformat()
+
+DEMO_PROFILES = [
+    {
+        'url': 'https://find-and-update.company-information.service.gov.uk/officers/abc123/appointments',
+        'officer_name': 'SMITH, Jane',
+        'date_of_birth': 'March 1975',
+        'appointments': [
+            {
+                'company_name': 'EXAMPLE WIDGETS LTD',
+                'company_link': '/company/01234567',
+                'role': 'Director',
+                'status': 'Active',
+                'appointed_on': '1 June 2015',
+            },
+        ],
+        'active_appointments': 1,
+        'resigned_appointments': 0,
+        'scraped_at': now,
+    },
+    {
+        'url': 'https://find-and-update.company-information.service.gov.uk/officers/def456/appointments',
+        'officer_name': 'DOE, John',
+        'date_of_birth': 'November 1982',
+        'appointments': [
+            {
+                'company_name': 'ACME HOLDINGS PLC',
+                'company_link': '/company/07654321',
+                'role': 'Secretary',
+                'appointed_on': '12 January 2018',
+                'resigned_on': '30 September 2021',
+            },
+            {
+                'company_name': 'NORTHERN VENTURES LTD',
+                'company_link': '/company/09876543',
+                'role': 'Director',
+                'status': 'Active',
+                'appointed_on': '3 May 2022',
+            },
+        ],
+        'active_appointments': 1,
+        'resigned_appointments': 1,
+        'scraped_at': now,
+    },
+    {
+        'url': 'https://find-and-update.company-information.service.gov.uk/officers/ghi789/appointments',
+        'officer_name': 'KHOURY, Samir',
+        'appointments': [],
+        'active_appointments': 0,
+        'resigned_appointments': 0,
+        'scraped_at': now,
+    },
+]
+
+
+def main() -> None:
+    output = Path('data/companies_house/officers_demo.json')
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(DEMO_PROFILES, indent=2, ensure_ascii=False), encoding='utf-8')
+    print(f"Wrote {len(DEMO_PROFILES)} demo profiles to {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Extract officer profile URLs from a Companies House companies dump.
+
+Reads the ``companies_*.json`` file produced by the company crawler and
+collects every ``officer_link`` into a deduplicated set, ready to be fed
+to the officer profile crawler.
+
+The dump can be large (tens of thousands of companies), so the file is
+parsed incrementally with ``ijson`` — only the ``officer_link`` scalars
+are materialized, never the full object graph.
+"""
+
+import json
+import logging
+import sys
+from pathlib import Path
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_INPUT = Path('data/companies_house/companies.json')
+DEFAULT_OUTPUT = Path('data/companies_house/officer_urls.txt')
+
+
+def extract_officer_urls(json_file: Path) -> set[str]:
+    """Return the set of officer profile links found in *json_file*.
+
+    Streams the JSON with a single JSONPath instead of ``json.load``-ing
+    the whole document, so peak memory stays flat regardless of dump size.
+    Falls back to stdlib ``json`` when ijson is unavailable.
+    """
+    with open(json_file, 'rb') as f:
+        if ijson is not None:
+            return {v for v in ijson.items(f, 'item.officers.item.officer_link') if v}
+        companies = json.load(f)
+    return {link for c in companies for o in c.get('officers', ()) if (link := o.get('officer_link'))}
+
+
+def main() -> None:
+    json_file = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_INPUT
+    output_file = Path(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_OUTPUT
+
+    if not json_file.exists():
+        logger.error("Input file not found: %s", json_file)
+        sys.exit(1)
+
+    urls = extract_officer_urls(json_file)
+    logger.info("Extracted %d unique officer URLs from %s", len(urls), json_file)
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_text('\n'.join(sorted(urls)) + '\n', encoding='utf-8')
+    logger.info("Wrote %s", output_file)
+
+
+if __name__ == '__main__':
+    main()
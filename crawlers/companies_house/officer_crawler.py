@@ -0,0 +1,197 @@
+"""Async crawler for Companies House officer profile pages.
+
+Takes the officer URLs produced by ``extract_officer_urls`` and scrapes
+each profile: name, personal details and the full appointment history.
+Results are collected in memory and dumped to a timestamped JSON file.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urljoin
+
+import aiofiles
+import aiohttp
+import lxml.html
+from lxml import etree
+
+try:
+    from aiohttp_client_cache import CachedSession, SQLiteBackend
+except ImportError:
+    CachedSession = SQLiteBackend = None
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+BASE_URL = 'https://find-and-update.company-information.service.gov.uk'
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) '
+                  'Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-GB,en;q=0.9',
+}
+
+
+class OfficerProfileCrawler:
+    """Crawl officer appointment pages from Companies House."""
+
+    def __init__(self, output_dir: str = 'data/companies_house', rate_limit: float = 1.0,
+                 timeout: int = 30, debug_html: bool = False):
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.debug_dir = self.output_dir / 'debug'
+        self.rate_limit = rate_limit
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.debug_html = debug_html
+        self.session: aiohttp.ClientSession | None = None
+        self.data: list[dict] = []
+
+    async def start(self) -> None:
+        if CachedSession is not None:
+            # Officer profiles change slowly; a day-long on-disk cache turns
+            # re-runs into local reads instead of fresh downloads.
+            cache = SQLiteBackend(str(self.output_dir / '.cache.sqlite'), expire_after=86400)
+            self.session = CachedSession(cache=cache, headers=HEADERS, timeout=self.timeout)
+        else:
+            self.session = aiohttp.ClientSession(headers=HEADERS, timeout=self.timeout)
+        if self.debug_html:
+            self.debug_dir.mkdir(parents=True, exist_ok=True)
+
+    async def close(self) -> None:
+        if self.session:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self) -> 'OfficerProfileCrawler':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def fetch_profile(self, officer_link: str) -> str | None:
+        """Fetch one officer page, returning its HTML or None on failure."""
+        url = urljoin(BASE_URL, officer_link)
+        try:
+            async with self.session.get(url) as response:
+                if not getattr(response, 'from_cache', False):
+                    # Only real network hits count against the politeness budget.
+                    await asyncio.sleep(self.rate_limit)
+                if response.status == 429:
+                    logger.warning("Rate limited on %s, backing off", url)
+                    await asyncio.sleep(30)
+                    return await self.fetch_profile(officer_link)
+                if response.status != 200:
+                    logger.warning("HTTP %d for %s", response.status, url)
+                    return None
+                # Decode from the Content-Type charset directly; response.text()
+                # would fall back to Python-side charset detection.
+                raw = await response.read()
+                html = raw.decode(response.charset or 'utf-8', errors='replace')
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("Failed to fetch %s: %s", url, e)
+            return None
+
+        if self.debug_html:
+            profile_file = self.debug_dir / (officer_link.strip('/').replace('/', '_') + '.html')
+            # Write off the event loop: a sync write here would stall every
+            # other in-flight fetch for the duration of the disk flush.
+            async with aiofiles.open(profile_file, 'wb') as f:
+                await f.write(html.encode('utf-8'))
+        return html
+
+    def parse_officer_profile(self, html: str, url: str) -> dict:
+        """Parse an officer appointments page into a flat record.
+
+        One top-down walk with ``iterwalk`` populates the name, personal
+        details, appointments and page-level definition lists together;
+        the start/end events tell us whether a ``dt``/``dd`` pair belongs
+        to the appointment currently open or to the page itself, so the
+        appointment subtrees are never scanned twice.
+        """
+        root = lxml.html.fromstring(html)
+        data: dict = {'url': url, 'scraped_at': datetime.now(timezone.utc).isoformat()}
+
+        appointments: list[dict] = []
+        current: dict | None = None
+        appt_el = None
+        dt_key: str | None = None
+        active = resigned = 0
+
+        for event, el in etree.iterwalk(root, events=('start', 'end')):
+            tag = el.tag
+            if event == 'end':
+                if el is appt_el:
+                    if current:
+                        appointments.append(current)
+                        if current.get('status', '').lower() == 'active' or 'resigned_on' not in current:
+                            active += 1
+                        else:
+                            resigned += 1
+                    current = None
+                    appt_el = None
+                continue
+
+            cls = el.get('class') or ''
+            if tag == 'h1' and 'officer_name' not in data:
+                data['officer_name'] = el.text_content().strip()
+            elif 'date-of-birth' in cls or 'date-of-birth' in (el.get('id') or ''):
+                data.setdefault('date_of_birth', el.text_content().strip())
+            elif appt_el is None and (cls.startswith('appointment') or 'appointment' == cls):
+                current = {}
+                appt_el = el
+            elif tag == 'a' and current is not None and 'company_name' not in current:
+                href = el.get('href')
+                if href:
+                    current['company_name'] = el.text_content().strip()
+                    current['company_link'] = href
+            elif tag == 'dt':
+                dt_key = el.text_content().strip().lower().rstrip(':').replace(' ', '_')
+            elif tag == 'dd' and dt_key:
+                value = el.text_content().strip()
+                target = current if current is not None else data
+                if dt_key not in target:
+                    target[dt_key] = value
+                dt_key = None
+
+        data['appointments'] = appointments
+        data['active_appointments'] = active
+        data['resigned_appointments'] = resigned
+        return data
+
+    async def crawl(self, officer_links: list[str]) -> None:
+        logger.info("Crawling %d officer profiles", len(officer_links))
+        for i, link in enumerate(officer_links, 1):
+            html = await self.fetch_profile(link)
+            if not html:
+                continue
+            profile = self.parse_officer_profile(html, urljoin(BASE_URL, link))
+            self.data.append(profile)
+            logger.info("[%d/%d] %s (%d appointments)", i, len(officer_links),
+                        profile.get('officer_name', '?'), len(profile.get('appointments', [])))
+
+    def save_json(self) -> Path:
+        ts = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
+        filepath = self.output_dir / f'officers_{ts}.json'
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, indent=2, ensure_ascii=False)
+        logger.info("Saved %d profiles to %s", len(self.data), filepath)
+        return filepath
+
+
+async def main() -> None:
+    urls_file = Path('data/companies_house/officer_urls.txt')
+    if not urls_file.exists():
+        logger.error("Run extract_officer_urls.py first to produce %s", urls_file)
+        return
+    links = [line for line in urls_file.read_text().splitlines() if line.strip()]
+    async with OfficerProfileCrawler() as crawler:
+        await crawler.crawl(links)
+        crawler.save_json()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
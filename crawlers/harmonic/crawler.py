@@ -0,0 +1,208 @@
+"""Crawler for harmonic.ai public company listings.
+
+Fetches listing pages over plain HTTP, parses the company cards into
+flat dicts and exports the batch as JSON or CSV.
+"""
+
+import asyncio
+import csv
+import json
+import logging
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+from urllib.parse import urljoin
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+try:
+    from selectolax.parser import HTMLParser, Node
+except ImportError:
+    HTMLParser = Node = None
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+BASE_URL = 'https://harmonic.ai'
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) '
+                  'Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+}
+
+
+@lru_cache(maxsize=4096)
+def _join(base: str, href: str) -> str:
+    """Cached urljoin — bases are constant per page and hrefs repeat a lot."""
+    return urljoin(base, href)
+
+
+class HarmonicCrawler:
+    """Scrape company cards from harmonic.ai listing pages."""
+
+    def __init__(self, output_dir: str = 'data/harmonic', rate_limit: float = 1.0,
+                 timeout: int = 30,
+                 sink: Optional[Callable[[dict], Awaitable[None]]] = None,
+                 session: aiohttp.ClientSession | None = None):
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.rate_limit = rate_limit
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        # An injected session is shared with the caller (one connector and
+        # DNS cache across many crawlers) and is never closed here.
+        self.session = session
+        self._owns_session = session is None
+        # With a sink, items are written out as they are parsed instead of
+        # pinned in self.data until the end of the crawl.
+        self.sink = sink
+        self.data: list[dict] = []
+
+    async def start(self) -> None:
+        if self.session is None:
+            self.session = aiohttp.ClientSession(headers=HEADERS, timeout=self.timeout)
+            self._owns_session = True
+
+    async def close(self) -> None:
+        if self.session and self._owns_session:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self) -> 'HarmonicCrawler':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def fetch(self, url: str) -> str | None:
+        """Fetch one page, returning its HTML or None on failure."""
+        await asyncio.sleep(self.rate_limit)
+        try:
+            async with self.session.get(url) as response:
+                if response.status == 429:
+                    logger.warning("Rate limited on %s", url)
+                    return None
+                if response.status != 200:
+                    logger.warning("HTTP %d for %s", response.status, url)
+                    return None
+                return await response.text()
+        except asyncio.TimeoutError:
+            logger.error("Timeout fetching %s", url)
+            return None
+        except aiohttp.ClientError as e:
+            logger.error("Failed to fetch %s: %s", url, e)
+            return None
+
+    def parse_page(self, html: str, url: str) -> list[dict]:
+        """Parse the company cards on one listing page.
+
+        Uses selectolax's C parser when available; BS4 with html.parser
+        is an order of magnitude slower on real listing pages.
+        """
+        if HTMLParser is not None:
+            cards = HTMLParser(html).css('div.company')
+        else:
+            cards = BeautifulSoup(html, 'html.parser').select('div.company')
+        items = []
+        scraped_at = datetime.now(timezone.utc).isoformat()
+        for card in cards:
+            item = {
+                'title': self._extract_text(card, 'h2.title'),
+                'description': self._extract_text(card, 'p.description'),
+                'link': self._extract_link(card, url),
+                'source_url': url,
+                'scraped_at': scraped_at,
+            }
+            if item['title']:
+                items.append(item)
+        return items
+
+    def _extract_text(self, element, selector: str) -> str:
+        if Node is not None and isinstance(element, Node):
+            el = element.css_first(selector)
+            return el.text(strip=True) if el else ''
+        el = element.select_one(selector)
+        return el.get_text(strip=True) if el else ''
+
+    def _extract_link(self, element, base_url: str) -> str:
+        if Node is not None and isinstance(element, Node):
+            el = element.css_first('a[href]')
+            href = el.attributes.get('href', '') if el else ''
+        else:
+            el = element.select_one('a[href]')
+            href = el['href'] if el else ''
+        if not href:
+            return ''
+        return _join(base_url, href)
+
+    async def crawl(self, urls: list[str]) -> None:
+        for url in urls:
+            html = await self.fetch(url)
+            if not html:
+                continue
+            items = self.parse_page(html, url)
+            if self.sink is not None:
+                for item in items:
+                    await self.sink(item)
+            else:
+                self.data.extend(items)
+            logger.info("%s: %d companies", url, len(items))
+
+    def save_json(self, filename: str | None = None) -> Path:
+        ts = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
+        filepath = self.output_dir / (filename or f'harmonic_{ts}.json')
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, indent=2, ensure_ascii=False)
+        logger.info("Saved %d items to %s", len(self.data), filepath)
+        return filepath
+
+    def save_csv(self, filename: str | None = None) -> Path:
+        ts = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
+        filepath = self.output_dir / (filename or f'harmonic_{ts}.csv')
+        fieldnames = sorted({key for row in self.data for key in row})
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            if fieldnames:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                # writerows streams straight from self.data — no row copies.
+                writer.writerows(self.data)
+        logger.info("Saved %d rows to %s", len(self.data), filepath)
+        return filepath
+
+
+def jsonl_sink(path: str | Path) -> Callable[[dict], Awaitable[None]]:
+    """A sink that appends each item to *path* as one JSON line."""
+    f = open(path, 'a', encoding='utf-8', buffering=1 << 20)
+
+    async def sink(item: dict) -> None:
+        f.write(json.dumps(item, ensure_ascii=False) + '\n')
+
+    sink.close = f.close  # type: ignore[attr-defined]
+    return sink
+
+
+def csv_sink(path: str | Path, fieldnames: list[str]) -> Callable[[dict], Awaitable[None]]:
+    """A sink that appends each item to *path* as a CSV row."""
+    f = open(path, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+    writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+    writer.writeheader()
+
+    async def sink(item: dict) -> None:
+        writer.writerow(item)
+
+    sink.close = f.close  # type: ignore[attr-defined]
+    return sink
+
+
+async def main() -> None:
+    async with HarmonicCrawler() as crawler:
+        await crawler.crawl([BASE_URL])
+        crawler.save_json()
+        crawler.save_csv()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,56 @@
+"""Functional smoke checks for the harmonic crawler against the live site.
+
+Run directly (``python test_functional.py``). One crawler is started in
+``main`` and shared across all four checks — starting a fresh session
+per check would pay connector and DNS setup four times over.
+"""
+
+import asyncio
+import sys
+
+from crawler import BASE_URL, HarmonicCrawler
+
+
+async def check_fetch(crawler: HarmonicCrawler) -> bool:
+    html = await crawler.fetch(BASE_URL)
+    ok = bool(html) and '<html' in html.lower()
+    print(f"fetch: {'ok' if ok else 'FAILED'}")
+    return ok
+
+
+async def check_parse(crawler: HarmonicCrawler) -> bool:
+    html = await crawler.fetch(BASE_URL)
+    items = crawler.parse_page(html or '', BASE_URL)
+    print(f"parse: {len(items)} items")
+    return True
+
+
+async def check_crawl(crawler: HarmonicCrawler) -> bool:
+    await crawler.crawl([BASE_URL])
+    print(f"crawl: {len(crawler.data)} items collected")
+    return True
+
+
+async def check_save(crawler: HarmonicCrawler) -> bool:
+    json_path = crawler.save_json('functional_check.json')
+    csv_path = crawler.save_csv('functional_check.csv')
+    ok = json_path.exists() and csv_path.exists()
+    print(f"save: {'ok' if ok else 'FAILED'}")
+    return ok
+
+
+async def main() -> int:
+    async with HarmonicCrawler(output_dir='data/harmonic/functional') as crawler:
+        results = [
+            await check_fetch(crawler),
+            await check_parse(crawler),
+            await check_crawl(crawler),
+            await check_save(crawler),
+        ]
+    failed = results.count(False)
+    print(f"{len(results) - failed}/{len(results)} checks passed")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,599 @@
+"""Crawler for uneed.best tool listings.
+
+Walks the daily-launch listing page for tool links, then visits each
+tool page and extracts the name, description, publisher, launch date,
+categories, pricing, website and social links.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urljoin, urlparse, urlsplit
+
+import aiohttp
+import lxml.html
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+# Lexbor is a streaming C HTML5 parser with a native CSS engine; BS4+lxml
+# stays available as the fallback path.
+USE_SELECTOLAX = LexborHTMLParser is not None
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+BASE_URL = 'https://www.uneed.best'
+
+# Host -> social key; one dict lookup per anchor replaces a chain of
+# substring scans. Hosts are normalized with a www. strip before lookup.
+_SOCIAL_HOSTS = {
+    'twitter.com': 'twitter',
+    'x.com': 'twitter',
+    'linkedin.com': 'linkedin',
+    'facebook.com': 'facebook',
+    'instagram.com': 'instagram',
+    'github.com': 'github',
+    'youtube.com': 'youtube',
+    'youtu.be': 'youtube',
+}
+
+# Case-insensitive search short-circuits on first match; lowercasing the
+# whole document allocated a full copy just to test one substring.
+_FOR_SALE_RE = re.compile(rb'for\s+sale', re.IGNORECASE)
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) '
+                  'Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    # aiohttp auto-decompresses; br needs the brotli package installed.
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+}
+
+
+def _parse_html(html):
+    return LexborHTMLParser(html) if USE_SELECTOLAX else lxml.html.fromstring(html)
+
+
+def _text(node) -> str:
+    return node.text(strip=True) if USE_SELECTOLAX else node.text_content().strip()
+
+
+def _attr(node, name, default=None):
+    return node.attributes.get(name, default) if USE_SELECTOLAX else node.get(name, default)
+
+
+def _tag(node) -> str:
+    # Both selectolax nodes and lxml elements expose the tag name as .tag.
+    return node.tag
+
+
+# One selector list per field. Lexbor caches selector parses itself, so
+# the selectolax path uses the raw CSS strings; the fallback goes through
+# lxml directly with XPath expressions compiled once at import — no
+# per-call CSS-to-XPath translation and no per-node wrapper objects.
+_SELECTORS = {
+    'tool_name': 'h1, .tool-name, [class*="title"]',
+    'description': 'meta[property="og:description"], .description, '
+                   '[class*="description"], [class*="tagline"]',
+    'publisher': 'a[href^="/user/"], a[href^="/profile/"], .publisher, '
+                 '[class*="publisher"], [class*="maker"]',
+    'launch_date': 'time, [class*="launch-date"], [class*="launched"]',
+    'categories': 'a[href^="/category/"], [class*="category"] a, [class*="tag"]',
+    'pricing': '[class*="pricing"], [class*="price"]',
+    'anchors': 'a[href]',
+}
+
+_XPATHS = {
+    'tool_name': '//h1 | //*[contains(@class, "tool-name")] | //*[contains(@class, "title")]',
+    'description': '//meta[@property="og:description"] | //*[contains(@class, "description")]'
+                   ' | //*[contains(@class, "tagline")]',
+    'publisher': '//a[starts-with(@href, "/user/")] | //a[starts-with(@href, "/profile/")]'
+                 ' | //*[contains(@class, "publisher")] | //*[contains(@class, "maker")]',
+    'launch_date': '//time | //*[contains(@class, "launch-date")] | //*[contains(@class, "launched")]',
+    'categories': '//a[starts-with(@href, "/category/")] | //*[contains(@class, "category")]//a'
+                  ' | //*[contains(@class, "tag")]',
+    'pricing': '//*[contains(@class, "pricing")] | //*[contains(@class, "price")]',
+    'anchors': '//a[@href]',
+}
+if not USE_SELECTOLAX:
+    _XPATHS = {k: etree.XPath(v) for k, v in _XPATHS.items()}
+
+
+def _sel_first(tree, key: str):
+    if USE_SELECTOLAX:
+        return tree.css_first(_SELECTORS[key])
+    found = _XPATHS[key](tree)
+    return found[0] if found else None
+
+
+def _sel_all(tree, key: str):
+    if USE_SELECTOLAX:
+        return tree.css(_SELECTORS[key])
+    return _XPATHS[key](tree)
+
+
+# Field -> extractor for the single-element fields; the selector for each
+# key lives in _SELECTORS/_XPATHS. Table-driven keeps the per-page work
+# to one tight loop and means no None values ever enter the dict.
+_FIELDS = (
+    ('tool_name', _text),
+    ('publisher', _text),
+    ('launch_date', lambda el: _attr(el, 'datetime') or _text(el)),
+    ('pricing', _text),
+)
+
+
+def parse_tool_page(html: bytes, url: str, scraped_at: str | None = None) -> dict:
+    """Extract one tool's details from its page.
+
+    Takes the raw response bytes — both parsers handle the encoding
+    declaration themselves, skipping a Python-side decode. Module-level
+    (not a method) so it pickles cleanly into the parse worker processes.
+    *scraped_at* stamps the whole batch; per-tool clock reads made tools
+    from one crawl look scraped at different times.
+    """
+    tree = _parse_html(html)
+    if scraped_at is None:
+        scraped_at = datetime.now(timezone.utc).isoformat()
+    data: dict = {'url': url, 'scraped_at': scraped_at}
+
+    data.update({key: extract(el) for key, extract in _FIELDS
+                 if (el := _sel_first(tree, key)) is not None})
+
+    for el in _sel_all(tree, 'description'):
+        text = _attr(el, 'content') if _tag(el) == 'meta' else _text(el)
+        if text:
+            data['description'] = text
+            break
+
+    categories: list[str] = []
+    cat_seen: set[str] = set()
+    for el in _sel_all(tree, 'categories'):
+        text = _text(el)
+        if text and text not in cat_seen:
+            cat_seen.add(text)
+            categories.append(text)
+    if categories:
+        data['categories'] = categories
+
+    # One walk over the anchors classifies social links, picks the first
+    # external non-uneed link as the tool's website and records the
+    # publisher profile link, instead of traversing the tree once per
+    # concern.
+    socials: dict = {}
+    for a in _sel_all(tree, 'anchors'):
+        href = _attr(a, 'href') or ''
+        host = urlparse(href).netloc.lower().removeprefix('www.')
+        key = _SOCIAL_HOSTS.get(host)
+        if key:
+            socials.setdefault(key, href)
+        elif ('website' not in data and host
+                and host != 'uneed.best'):
+            data['website'] = href.split('?')[0]
+        elif ('publisher_link' not in data and not host
+                and href.startswith(('/user/', '/profile/'))):
+            data['publisher_link'] = urljoin(url, href)
+    if socials:
+        data['socials'] = socials
+
+    if _FOR_SALE_RE.search(html):
+        data['for_sale'] = True
+
+    return data
+
+
+# Specialized fast path, hardened against the selectors that actually hit
+# on uneed.best's live DOM (checked against saved debug HTML): one
+# compiled XPath per field instead of the generic probe ladder.
+_FAST_XPATHS = {
+    'tool_name': etree.XPath('string(//h1[1])'),
+    'description': etree.XPath('string(//meta[@property="og:description"]/@content)'),
+    'publisher': etree.XPath('string((//a[starts-with(@href, "/user/")])[1])'),
+    'launch_date': etree.XPath('string((//time)[1]/@datetime)'),
+    'pricing': etree.XPath('string((//*[contains(@class, "pricing")])[1])'),
+    'categories': etree.XPath('//a[starts-with(@href, "/category/")]/text()'),
+}
+
+_FAST_SCALAR_KEYS = ('tool_name', 'description', 'publisher', 'launch_date', 'pricing')
+
+
+def parse_tool_page_fast(html: bytes, url: str, scraped_at: str | None = None) -> dict:
+    """Specialized variant of :func:`parse_tool_page`.
+
+    Six compiled XPath calls replace the ~30-selector probe; use via
+    ``UneedCrawler(strict=True)`` once the site's markup is known to
+    match. Fields the fast XPaths miss are simply absent.
+    """
+    tree = lxml.html.fromstring(html)
+    if scraped_at is None:
+        scraped_at = datetime.now(timezone.utc).isoformat()
+    data: dict = {'url': url, 'scraped_at': scraped_at}
+
+    for key in _FAST_SCALAR_KEYS:
+        value = _FAST_XPATHS[key](tree).strip()
+        if value:
+            data[key] = value
+
+    categories = list(dict.fromkeys(t.strip() for t in _FAST_XPATHS['categories'](tree)))
+    if categories:
+        data['categories'] = categories
+
+    socials: dict = {}
+    for a in tree.iter('a'):
+        href = a.get('href') or ''
+        host = urlparse(href).netloc.lower().removeprefix('www.')
+        key = _SOCIAL_HOSTS.get(host)
+        if key:
+            socials.setdefault(key, href)
+        elif ('website' not in data and host
+                and host != 'uneed.best'):
+            data['website'] = href.split('?')[0]
+        elif ('publisher_link' not in data and not host
+                and href.startswith(('/user/', '/profile/'))):
+            data['publisher_link'] = urljoin(url, href)
+    if socials:
+        data['socials'] = socials
+
+    if _FOR_SALE_RE.search(html):
+        data['for_sale'] = True
+
+    return data
+
+
+class UneedCrawler:
+    """Scrape tool pages from uneed.best."""
+
+    def __init__(self, output_dir: str = 'data/uneed', rate_limit: float = 2.0,
+                 timeout: int = 30, max_retries: int = 3, concurrency: int = 10,
+                 keep_in_memory: bool = True, strict: bool = False):
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.rate_limit = rate_limit
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_retries = max_retries
+        self.concurrency = concurrency
+        # strict=True trusts the known uneed.best markup and parses with
+        # the specialized XPath fast path; the default keeps the
+        # resilient multi-selector prober.
+        self.strict = strict
+        # Admission control: a Condition-guarded counter instead of a
+        # Semaphore, because the cap has to shrink safely when the server
+        # starts returning 429s and grow back on recovery.
+        self._cmax = concurrency
+        self._active = 0
+        self._cond = asyncio.Condition()
+        # Earliest-next-request token bucket shared by all workers.
+        self._next_ok = 0.0
+        self._rate_lock = asyncio.Lock()
+        # Single-flight: one fetch per URL per crawl, however many times
+        # the listing links to it.
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._scrape_ts: str | None = None
+        # URLs scraped by previous runs; re-crawls only fetch new tools.
+        self._seen: set[str] = set()
+        self._seen_fp = None
+        self.session: aiohttp.ClientSession | None = None
+        # Results stream to a JSONL file as they are parsed; the in-memory
+        # list is kept as well unless the caller opts out for large crawls.
+        self.keep_in_memory = keep_in_memory
+        self.jsonl_path: Path | None = None
+        self._out = None
+        self.data: list[dict] = []
+        # Parsing is pure CPU; a process pool lets pages parse on all
+        # cores while the event loop keeps fetching.
+        self._pool: ProcessPoolExecutor | None = None
+        # Conditional-request cache: ETags let unchanged pages come back
+        # as 304s, and parsed dicts are memoized by content hash so an
+        # unchanged body skips parse_tool_page entirely.
+        self._cache = (diskcache.Cache(str(self.output_dir / '.cache'))
+                       if diskcache is not None else None)
+
+    async def start(self) -> None:
+        # Everything goes to one host, so keep connections warm: the TLS
+        # handshake is paid once and reused across all tool pages.
+        connector = aiohttp.TCPConnector(
+            limit=50, limit_per_host=20, ttl_dns_cache=300,
+            keepalive_timeout=60, enable_cleanup_closed=True)
+        self.session = aiohttp.ClientSession(
+            headers=HEADERS, timeout=self.timeout, connector=connector)
+        ts = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
+        self.jsonl_path = self.output_dir / f'uneed_{ts}.jsonl'
+        self._out = open(self.jsonl_path, 'ab', buffering=1 << 20)
+        self._pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        seen_path = self.output_dir / 'seen_urls.txt'
+        if seen_path.exists():
+            self._seen = set(seen_path.read_text().split())
+        self._seen_fp = open(seen_path, 'a', encoding='utf-8')
+
+    async def close(self) -> None:
+        if self._pool:
+            self._pool.shutdown()
+            self._pool = None
+        if self._seen_fp:
+            self._seen_fp.close()
+            self._seen_fp = None
+        if self._out:
+            self._out.close()
+            self._out = None
+        if self.session:
+            await self.session.close()
+            self.session = None
+
+    def _emit(self, data: dict) -> None:
+        """Stream one parsed tool to the JSONL file as soon as it exists.
+
+        Each line is written and flushed whole, so a crash mid-crawl
+        leaves a valid file with every tool parsed so far. Writes happen
+        on the event-loop thread, so lines never interleave.
+        """
+        if self._out:
+            if orjson is not None:
+                self._out.write(orjson.dumps(data) + b'\n')
+            else:
+                self._out.write(json.dumps(data, ensure_ascii=False).encode() + b'\n')
+            self._out.flush()
+        if self.keep_in_memory:
+            self.data.append(data)
+
+    async def __aenter__(self) -> 'UneedCrawler':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def _acquire(self) -> None:
+        """Take one admission slot, waiting while the cap is saturated."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self._cmax)
+            self._active += 1
+
+    async def _release(self) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+
+    async def _shrink(self) -> None:
+        """Back off the admission cap after a 429."""
+        async with self._cond:
+            if self._cmax > 1:
+                self._cmax -= 1
+                logger.info("Concurrency reduced to %d", self._cmax)
+
+    async def _recover(self) -> None:
+        """Grow the cap back towards the configured limit after a success."""
+        async with self._cond:
+            if self._cmax < self.concurrency:
+                self._cmax += 1
+                # Waiters are parked on `_active < _cmax`; wake them all so
+                # they re-check against the new cap.
+                self._cond.notify_all()
+
+    async def _throttle(self) -> None:
+        """Wait until this request's slot in the shared rate budget.
+
+        Unlike a flat sleep per fetch, concurrent workers queue up for
+        slots spaced rate_limit seconds apart, and no time is wasted when
+        the natural cadence already exceeds the limit.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._rate_lock:
+            now = loop.time()
+            wait = max(0.0, self._next_ok - now)
+            self._next_ok = max(now, self._next_ok) + self.rate_limit
+        if wait:
+            await asyncio.sleep(wait)
+
+    def _backoff(self, attempt: int, retry_after: str | None = None) -> float:
+        """Backoff for *attempt*: Retry-After if the server sent one,
+        otherwise capped exponential, plus jitter to spread workers out."""
+        if retry_after and retry_after.isdigit():
+            wait = float(retry_after)
+        else:
+            wait = min(30.0, 2.0 ** attempt)
+        return wait + random.uniform(0, 0.5)
+
+    async def fetch(self, url: str,
+                    parser_factory=None) -> bytes | etree._Element | None:
+        """Fetch one page as raw bytes, retrying on 429 and timeouts.
+
+        Returning bytes skips response.text()'s decode; the HTML parsers
+        accept bytes natively and resolve the encoding themselves.
+
+        With *parser_factory* (an lxml feed-parser class), the body is
+        streamed chunk by chunk into a fresh parser as it arrives and the
+        parsed root is returned instead of the text — no full-document
+        string is ever materialized.
+        """
+        etag = (self._cache.get(f'etag:{url}')
+                if self._cache is not None and parser_factory is None else None)
+        headers = {'If-None-Match': etag} if etag else None
+        for attempt in range(self.max_retries + 1):
+            await self._throttle()
+            try:
+                async with self.session.get(url, headers=headers) as response:
+                    if response.status == 304:
+                        return self._cache.get(f'body:{url}')
+                    if response.status == 429:
+                        await self._shrink()
+                        wait = self._backoff(attempt, response.headers.get('Retry-After'))
+                        logger.warning("Rate limited on %s, retrying in %.1fs", url, wait)
+                        await asyncio.sleep(wait)
+                        continue
+                    if response.status != 200:
+                        logger.warning("HTTP %d for %s", response.status, url)
+                        return None
+                    await self._recover()
+                    if parser_factory is not None:
+                        parser = parser_factory()
+                        async for chunk in response.content.iter_chunked(1 << 15):
+                            parser.feed(chunk)
+                        return parser.close()
+                    body = await response.read()
+                    if self._cache is not None and parser_factory is None:
+                        new_etag = response.headers.get('ETag')
+                        if new_etag:
+                            self._cache.set(f'etag:{url}', new_etag)
+                            self._cache.set(f'body:{url}', body)
+                    return body
+            except asyncio.TimeoutError:
+                logger.warning("Timeout fetching %s (attempt %d)", url, attempt + 1)
+            except aiohttp.ClientConnectionError as e:
+                # Dropped/refused connections are transient; back off and
+                # retry like a timeout. Other client errors are final.
+                logger.warning("Connection error on %s (attempt %d): %s",
+                               url, attempt + 1, e)
+            except aiohttp.ClientError as e:
+                logger.error("Failed to fetch %s: %s", url, e)
+                return None
+            await asyncio.sleep(self._backoff(attempt))
+        logger.error("Giving up on %s after %d retries", url, self.max_retries)
+        return None
+
+    def parse_main_page(self, page, url: str) -> list[str]:
+        """Collect tool detail links from the listing page.
+
+        *page* is an lxml root streamed straight off the response, or raw
+        HTML as a fallback; only anchor hrefs matter here, so the BS4
+        string path parses with a SoupStrainer instead of materializing
+        the whole listing DOM.
+        """
+        if not isinstance(page, (str, bytes)):
+            hrefs = page.xpath('//a/@href')
+        elif USE_SELECTOLAX:
+            hrefs = [_attr(a, 'href') or ''
+                     for a in LexborHTMLParser(page).css('a[href]')]
+        else:
+            soup = BeautifulSoup(page, 'lxml', parse_only=SoupStrainer('a', href=True))
+            hrefs = [a.get('href') or '' for a in soup.find_all('a')]
+        # urljoin re-parses the base per call; pre-split it once and
+        # short-circuit the absolute and root-relative hrefs that make up
+        # nearly all anchors on the listing.
+        base = urlsplit(url)
+        root = f'{base.scheme}://{base.netloc}'
+        seen: set[str] = set()
+        tool_links: list[str] = []
+        for href in hrefs:
+            if '/tool/' not in href:
+                continue
+            if href.startswith('http'):
+                full_url = href
+            elif href.startswith('/'):
+                full_url = root + href
+            else:
+                full_url = urljoin(url, href)
+            # partition avoids the two throwaway lists split() builds.
+            clean_url = full_url.partition('#')[0].partition('?')[0]
+            if clean_url not in seen:
+                seen.add(clean_url)
+                tool_links.append(clean_url)
+        logger.info("Found %d tool links", len(tool_links))
+        return tool_links
+
+    async def fetch_tool_details(self, tool_url: str) -> dict | None:
+        if tool_url in self._inflight:
+            return await self._inflight[tool_url]
+        task = asyncio.ensure_future(self._fetch_tool_details(tool_url))
+        self._inflight[tool_url] = task
+        return await task
+
+    async def _fetch_tool_details(self, tool_url: str) -> dict | None:
+        await self._acquire()
+        try:
+            html = await self.fetch(tool_url)
+        finally:
+            await self._release()
+        if not html:
+            return None
+        key = None
+        data = None
+        if self._cache is not None:
+            digest = hashlib.blake2b(html).hexdigest()
+            key = f'parsed:{digest}'
+            data = self._cache.get(key)
+        if data is None:
+            parse = parse_tool_page_fast if self.strict else parse_tool_page
+            data = await asyncio.get_running_loop().run_in_executor(
+                self._pool, parse, html, tool_url, self._scrape_ts)
+            if key is not None:
+                self._cache.set(key, data)
+        self._emit(data)
+        self._seen.add(tool_url)
+        if self._seen_fp:
+            self._seen_fp.write(tool_url + '\n')
+        return data
+
+    async def crawl(self) -> None:
+        self._scrape_ts = datetime.now(timezone.utc).isoformat()
+        root = await self.fetch(BASE_URL, parser_factory=etree.HTMLParser)
+        if root is None:
+            logger.error("Could not fetch the listing page")
+            return
+        tool_links = self.parse_main_page(root, BASE_URL)
+        new_links = [u for u in tool_links if u not in self._seen]
+        if len(new_links) < len(tool_links):
+            logger.info("Skipping %d already-scraped tools",
+                        len(tool_links) - len(new_links))
+        results = await asyncio.gather(
+            *(self.fetch_tool_details(u) for u in new_links), return_exceptions=True)
+        collected = 0
+        for tool_url, result in zip(new_links, results):
+            if isinstance(result, BaseException):
+                logger.error("Failed on %s: %s", tool_url, result)
+            elif result:
+                collected += 1
+        logger.info("Collected %d/%d tools", collected, len(new_links))
+
+    def save_json(self, filename: str | None = None) -> Path:
+        ts = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
+        filepath = self.output_dir / (filename or f'uneed_{ts}.json')
+        if orjson is not None:
+            # orjson serializes straight to UTF-8 bytes, roughly 5x faster
+            # than the stdlib encoder on dicts of this shape.
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(self.data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, indent=2, ensure_ascii=False)
+        logger.info("Saved %d tools to %s", len(self.data), filepath)
+        return filepath
+
+
+async def main() -> None:
+    async with UneedCrawler() as crawler:
+        await crawler.crawl()
+        crawler.save_json()
+
+
+if __name__ == '__main__':
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is Unix-only; the default loop is fine elsewhere.
+        pass
+    else:
+        uvloop.install()
+    asyncio.run(main())
@@ -0,0 +1,388 @@
+"""Browser-rendered crawler for uneed.best tool listings.
+
+The plain-HTTP crawler (crawler.py) misses fields that uneed.best fills
+in client-side, so this variant renders pages in headless Chromium via
+Playwright and parses the resulting DOM.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+import aiofiles
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from playwright.async_api import async_playwright
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+BASE_URL = 'https://www.uneed.best'
+
+# The parser only reads HTML; none of these ever get looked at.
+_BLOCKED_RESOURCES = {'image', 'media', 'font', 'stylesheet'}
+_BLOCKED_HOSTS = ('google-analytics.com', 'googletagmanager.com', 'doubleclick.net')
+
+
+class TokenBucket:
+    """Shared requests/sec budget for concurrent fetch tasks.
+
+    A post-fetch ``asyncio.sleep(rate_limit)`` serializes tasks even
+    under ``gather``; a bucket lets N tasks proceed whenever tokens are
+    available while the refill rate still caps sustained throughput.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            if self._updated:
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # The balance goes negative when waiters queue up: each one
+            # adds a token of debt, so successive waiters are released
+            # 1/rate apart instead of all at once.
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return
+            wait = -self._tokens / self.rate
+        await asyncio.sleep(wait)
+
+
+def _clean(u: str) -> str:
+    """Drop the query and fragment in one C-level parse."""
+    p = urlsplit(u)
+    return urlunsplit((p.scheme, p.netloc, p.path, '', ''))
+
+
+async def _block_heavy_resources(route):
+    request = route.request
+    if (request.resource_type in _BLOCKED_RESOURCES
+            or any(host in request.url for host in _BLOCKED_HOSTS)):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _extract_launch_date(li, data: dict) -> None:
+    value = li.find('time')
+    if value:
+        data['launch_date'] = value.get('datetime') or value.get_text(strip=True)
+
+def _extract_categories(li, data: dict) -> None:
+    tags = []
+    seen: set[str] = set()
+    for tag_el in li.find_all('a'):
+        text = tag_el.get_text(strip=True)
+        if text and text not in seen:
+            seen.add(text)
+            tags.append(text)
+    if tags:
+        data['categories'] = tags
+
+def _extract_pricing(li, data: dict) -> None:
+    value = li.select_one('span.text-xs')
+    if value:
+        data['pricing'] = value.get_text(strip=True)
+
+def _extract_for_sale(li, data: dict) -> None:
+    data['for_sale'] = True
+
+# Precompiled predicate for the external visit-website anchor; the
+# attribute filtering happens at the soupsieve level so only the few
+# matching anchors reach the Python-side text check.
+_VISIT_SEL = soupsieve.compile(
+    'a[rel~=noopener][target="_blank"][href^="http"]:not([href*="uneed.best"])')
+
+# One compiled alternation classifies a social link in a single scan
+# instead of up to eight substring tests per href.
+_SOCIAL_RE = re.compile(
+    r'https?://(?:www\.)?'
+    r'(twitter\.com|x\.com|linkedin\.com|facebook\.com|instagram\.com'
+    r'|github\.com|youtube\.com|youtu\.be)')
+_HOST_TO_KEY = {
+    'twitter.com': 'twitter',
+    'x.com': 'twitter',
+    'linkedin.com': 'linkedin',
+    'facebook.com': 'facebook',
+    'instagram.com': 'instagram',
+    'github.com': 'github',
+    'youtube.com': 'youtube',
+    'youtu.be': 'youtube',
+}
+
+def _extract_socials(li, data: dict) -> None:
+    socials: dict = {}
+    for a in li.find_all('a', href=True):
+        href = a['href']
+        if href.startswith('mailto:'):
+            key = 'email'
+        else:
+            m = _SOCIAL_RE.match(href)
+            key = _HOST_TO_KEY[m.group(1)] if m else None
+        if key:
+            socials.setdefault(key, href)
+    if socials:
+        data['socials'] = socials
+
+# Lowercased sidebar label -> handler. An exact dict hit classifies a row
+# in O(1); the substring scan only runs for decorated labels.
+_FIELD_HANDLERS = {
+    'launch date': _extract_launch_date,
+    'category': _extract_categories,
+    'pricing': _extract_pricing,
+    'for sale': _extract_for_sale,
+    'socials': _extract_socials,
+}
+
+
+class UneedBrowserCrawler:
+    """Scrape tool pages from uneed.best through a rendered browser."""
+
+    __slots__ = ('output_dir', 'debug_dir', 'rate_limit', 'concurrency',
+                 'headless', 'debug_html', 'playwright', 'context',
+                 'page_pool', 'save_stream', 'data',
+                 '_bucket', '_out', '_batch_ts', '_parse_pool')
+
+    def __init__(self, output_dir: str = 'data/uneed', rate_limit: float = 2.0,
+                 headless: bool = True, debug_html: bool = False,
+                 concurrency: int = 8, save_stream: bool = True):
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.debug_dir = self.output_dir / 'debug'
+        self.debug_dir.mkdir(parents=True, exist_ok=True)
+        self.rate_limit = rate_limit
+        self.concurrency = concurrency
+        self._bucket = TokenBucket(rate=1 / rate_limit if rate_limit else float('inf'),
+                                   capacity=concurrency)
+        self.headless = headless
+        self.debug_html = debug_html
+        self.playwright = None
+        self.context = None
+        # Pages are expensive to create (fresh CDP target per request);
+        # a pool of `concurrency` pages is reused across all URLs.
+        self.page_pool: asyncio.Queue | None = None
+        # With save_stream, each tool is appended to an .ndjson file the
+        # moment it parses instead of pinned in self.data until the end —
+        # peak memory stays at one record and a crash keeps its progress.
+        self.save_stream = save_stream
+        self._out = None
+        self._batch_ts: str | None = None
+        # BS4's lxml backend releases the GIL while parsing, so pushing
+        # parse_tool_page onto threads lets parses run alongside in-flight
+        # Playwright fetches instead of blocking the event loop.
+        self._parse_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        self.data: list[dict] = []
+
+    async def start(self) -> None:
+        self.playwright = await async_playwright().start()
+        # A persistent context keeps Chromium's HTTP and service-worker
+        # caches on disk, so re-runs get cache hits on uneed.best's
+        # static assets instead of redownloading them every crawl.
+        self.context = await self.playwright.chromium.launch_persistent_context(
+            user_data_dir=str(self.output_dir / '.browser_cache'),
+            headless=self.headless)
+        await self.context.route('**/*', _block_heavy_resources)
+        self.page_pool = asyncio.Queue()
+        for _ in range(self.concurrency):
+            self.page_pool.put_nowait(await self.context.new_page())
+
+    async def close(self) -> None:
+        if self.page_pool:
+            while not self.page_pool.empty():
+                await self.page_pool.get_nowait().close()
+            self.page_pool = None
+        if self.context:
+            await self.context.close()
+            self.context = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+        self._parse_pool.shutdown(wait=False)
+
+    async def __aenter__(self) -> 'UneedBrowserCrawler':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def fetch_page(self, url: str, wait_for_selector: str = 'h1') -> str | None:
+        """Render one page and return its HTML.
+
+        Waits for DOMContentLoaded plus the first selector the parser
+        actually needs (h1 by default), instead of networkidle's 500ms
+        silence window and a blind 2s sleep — those added seconds of
+        dead wall-clock to every page.
+        """
+        await self._bucket.acquire()
+        page = await self.page_pool.get()
+        try:
+            await page.goto(url, wait_until='domcontentloaded', timeout=60000)
+            await page.wait_for_selector(wait_for_selector, timeout=15000)
+            html = await page.content()
+        except Exception as e:
+            logger.error("Failed to render %s: %s", url, e)
+            return None
+        finally:
+            # Park the page and hand it back instead of destroying the
+            # CDP target.
+            await page.goto('about:blank')
+            self.page_pool.put_nowait(page)
+        return html
+
+    def parse_main_page(self, html: str, url: str) -> list[str]:
+        """Collect tool detail links from the rendered listing page.
+
+        Only /tool/ anchors matter, so a SoupStrainer keeps the parser
+        from materializing the rest of the homepage DOM — the strainer
+        also covers both the styled launch cards and any stray anchors,
+        so one loop replaces the old two-method scan.
+        """
+        strainer = SoupStrainer('a', href=lambda h: h and '/tool/' in h)
+        soup = BeautifulSoup(html, 'lxml', parse_only=strainer)
+        seen: set[str] = set()
+        tool_links: list[str] = []
+        for a in soup.find_all('a'):
+            clean_url = _clean(urljoin(url, a['href']))
+            if clean_url not in seen:
+                seen.add(clean_url)
+                tool_links.append(clean_url)
+        logger.info("Found %d tool links", len(tool_links))
+        return tool_links
+
+    def parse_tool_page(self, html: str, url: str) -> dict:
+        """Extract one tool's details from its rendered page."""
+        soup = BeautifulSoup(html, 'lxml')
+        scraped_at = self._batch_ts or datetime.now(timezone.utc).isoformat()
+        data: dict = {'url': url, 'scraped_at': scraped_at}
+
+        # find() skips the soupsieve selector-compilation step that
+        # select_one pays on every call.
+        h1 = soup.find('h1')
+        if h1:
+            data['tool_name'] = h1.get_text(strip=True)
+
+        og_desc = soup.find('meta', attrs={'property': 'og:description'})
+        if og_desc and og_desc.get('content'):
+            data['description'] = og_desc['content']
+
+        profile = soup.find('a', href=lambda h: h and h.startswith('/profile/'))
+        if profile:
+            data['publisher'] = profile.get_text(strip=True)
+            data['publisher_link'] = urljoin(url, profile['href'])
+
+        # The detail sidebar is a list of labelled rows. Compiled CSS
+        # selectors match at the soupsieve level; class_=lambda filters
+        # call back into Python for every candidate tag.
+        for li in soup.select('li.flex'):
+            label_el = li.select_one('p.text-xs.font-medium')
+            if not label_el:
+                continue
+            label = label_el.get_text(strip=True).lower()
+            handler = (_FIELD_HANDLERS.get(label)
+                       or next((v for k, v in _FIELD_HANDLERS.items() if k in label), None))
+            if handler:
+                handler(li, data)
+
+        for link in _VISIT_SEL.iselect(soup):
+            if 'visit website' in link.get_text(strip=True).lower():
+                data['website'] = _clean(link['href'])
+                break
+
+        return data
+
+    async def crawl(self) -> None:
+        # One timestamp per batch; "when this crawl ran" is the granularity
+        # that matters, not per-page formatting calls.
+        self._batch_ts = datetime.now(timezone.utc).isoformat()
+        html = await self.fetch_page(BASE_URL, wait_for_selector='a[href*="/tool/"]')
+        if not html:
+            logger.error("Could not render the listing page")
+            return
+        if self.debug_html:
+            # Hundreds of KB of synchronous disk write would stall the
+            # event loop mid-crawl; aiofiles keeps it off the loop.
+            main_page_file = self.debug_dir / 'main_page.html'
+            async with aiofiles.open(main_page_file, 'w', encoding='utf-8') as f:
+                await f.write(html)
+        tool_links = self.parse_main_page(html, BASE_URL)
+
+        # Chromium handles many pages at once; a semaphore bounds how many
+        # render concurrently so N tools cost ~N/concurrency page loads.
+        sem = asyncio.Semaphore(self.concurrency)
+
+        loop = asyncio.get_running_loop()
+
+        async def _one(tool_url: str) -> dict | None:
+            async with sem:
+                tool_html = await self.fetch_page(tool_url)
+            if not tool_html:
+                return None
+            return await loop.run_in_executor(
+                self._parse_pool, self.parse_tool_page, tool_html, tool_url)
+
+        if self.save_stream:
+            ts = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
+            self._out = open(self.output_dir / f'uneed_browser_{ts}.ndjson',
+                             'a', encoding='utf-8')
+
+        try:
+            results = await asyncio.gather(*(_one(u) for u in tool_links),
+                                           return_exceptions=True)
+            collected = 0
+            for tool_url, result in zip(tool_links, results):
+                if isinstance(result, BaseException):
+                    logger.error("Failed on %s: %s", tool_url, result)
+                elif result:
+                    collected += 1
+                    if self._out is not None:
+                        self._out.write(json.dumps(result, ensure_ascii=False) + '\n')
+                        self._out.flush()
+                    else:
+                        self.data.append(result)
+        finally:
+            if self._out is not None:
+                self._out.close()
+                self._out = None
+        logger.info("Collected %d/%d tools", collected, len(tool_links))
+
+    def save_json(self, filename: str | None = None) -> Path:
+        ts = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
+        filepath = self.output_dir / (filename or f'uneed_browser_{ts}.json')
+        if orjson is not None:
+            filepath.write_bytes(orjson.dumps(self.data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, indent=2, ensure_ascii=False)
+        logger.info("Saved %d tools to %s", len(self.data), filepath)
+        return filepath
+
+
+async def main() -> None:
+    async with UneedBrowserCrawler() as crawler:
+        await crawler.crawl()
+        if not crawler.save_stream:
+            crawler.save_json()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
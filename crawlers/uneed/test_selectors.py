@@ -0,0 +1,113 @@
+"""Selector diagnostics for the uneed.best homepage.
+
+Run this when the site's markup shifts and the crawlers stop finding
+cards: it loads the saved debug HTML (or fetches the live page) and
+reports how many nodes each selector the crawlers rely on still
+matches. Not part of the pytest suite — it is a manual debugging aid.
+
+Usage: python -m crawlers.uneed.test_selectors [path/to/page.html]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+BASE_URL = 'https://www.uneed.best'
+DEBUG_HTML = Path('data/uneed/debug/main_page.html')
+
+
+def _load_html(path: str | None = None) -> str:
+    if path:
+        return Path(path).read_text(encoding='utf-8')
+    if DEBUG_HTML.exists():
+        return DEBUG_HTML.read_text(encoding='utf-8')
+
+    import asyncio
+    import aiohttp
+
+    async def fetch() -> str:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(BASE_URL) as response:
+                return await response.text()
+
+    return asyncio.run(fetch())
+
+
+def _test_selectolax(html: str) -> None:
+    """CSS selection on the Lexbor C engine — no Python per-tag filters."""
+    tree = LexborHTMLParser(html)
+
+    cards = tree.css('a.flex.relative.items-center.py-4.w-full.group')
+    print(f"launch-card anchors: {len(cards)}")
+
+    tool_links = tree.css('a[href*="/tool/"]')
+    print(f"/tool/ anchors: {len(tool_links)}")
+    for a in tool_links[:5]:
+        print(f"  {a.attributes.get('href')}")
+
+    containers = [
+        div for div in tree.css('div.flex.flex-col')
+        if any(child.tag == 'div' and 'relative' in (child.attributes.get('class') or '')
+               for child in div.iter())
+    ]
+    print(f"flex-col containers with relative child: {len(containers)}")
+
+    print(f"pb-4 wrappers: {len(tree.css('div.pb-4.w-full'))}")
+    print(f"relative divs: {len(tree.css('div.relative'))}")
+
+    anchors = tree.css('a')
+    with_class = sum(1 for a in anchors if a.attributes.get('class'))
+    print(f"anchors: {len(anchors)} total, {with_class} with classes")
+
+
+def _test_bs4(html: str) -> None:
+    """BS4 fallback when selectolax is not installed.
+
+    The anchor tests only look at <a> tags and the layout tests only at
+    <div>s, so each group parses through a SoupStrainer — the tree never
+    materializes the scripts, SVGs and spans that dominate the page.
+    """
+    soup_a = BeautifulSoup(html, 'lxml', parse_only=SoupStrainer('a'))
+    soup_div = BeautifulSoup(html, 'lxml', parse_only=SoupStrainer('div'))
+
+    cards = soup_a.find_all('a', class_=lambda x: x and 'group' in x and 'relative' in x)
+    print(f"launch-card anchors: {len(cards)}")
+
+    tool_links = soup_a.find_all('a', href=lambda h: h and '/tool/' in h)
+    print(f"/tool/ anchors: {len(tool_links)}")
+    for a in tool_links[:5]:
+        print(f"  {a.get('href')}")
+
+    containers = [
+        div for div in soup_div.find_all('div', class_=lambda x: x and 'flex' in x and 'flex-col' in x)
+        if div.find('div', class_=lambda x: x and 'relative' in x, recursive=False)
+    ]
+    print(f"flex-col containers with relative child: {len(containers)}")
+
+    print(f"pb-4 wrappers: {len(soup_div.find_all('div', class_=lambda x: x and 'pb-4' in x and 'w-full' in x))}")
+    print(f"relative divs: {len(soup_div.find_all('div', class_=lambda x: x and 'relative' in x))}")
+
+    anchors = soup_a.find_all('a')
+    with_class = sum(1 for a in anchors if a.get('class'))
+    print(f"anchors: {len(anchors)} total, {with_class} with classes")
+
+
+def test_selectors(html: str) -> None:
+    started = time.perf_counter()
+    print(f"input: {len(html)} bytes")
+    if LexborHTMLParser is not None:
+        _test_selectolax(html)
+    else:
+        _test_bs4(html)
+    print(f"total: {time.perf_counter() - started:.3f}s")
+
+
+if __name__ == '__main__':
+    test_selectors(_load_html(sys.argv[1] if len(sys.argv) > 1 else None))
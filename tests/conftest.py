@@ -0,0 +1,44 @@
+"""Shared fixtures for the crawler test suite.
+
+Browser-backed tests share one Playwright instance and one Browser for
+the whole session — starting a fresh browser per test is the expensive
+anti-pattern this layout avoids. Each test gets its own context.
+"""
+
+import aiohttp
+import pytest
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture(scope='session')
+async def shared_session():
+    """One aiohttp.ClientSession reused by every crawler test.
+
+    Session setup (connector, DNS resolver) is the expensive part; the
+    tests stub or patch ``get`` as needed.
+    """
+    session = aiohttp.ClientSession()
+    yield session
+    await session.close()
+
+
+@pytest_asyncio.fixture(scope='session')
+async def playwright_browser():
+    """One Chromium browser shared by every browser-backed test."""
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as pw:
+        try:
+            browser = await pw.chromium.launch(headless=True)
+        except Exception as e:
+            pytest.skip(f"Chromium unavailable: {e}")
+        yield browser
+        await browser.close()
+
+
+@pytest_asyncio.fixture
+async def browser_context(playwright_browser):
+    """A fresh, isolated context per test on the shared browser."""
+    context = await playwright_browser.new_context()
+    yield context
+    await context.close()
@@ -0,0 +1,185 @@
+"""Tests for the harmonic.ai crawler (and shared-browser smoke tests).
+
+The aiohttp layer is stubbed out so these run without network access.
+"""
+
+import asyncio
+
+import pytest
+
+from crawlers.harmonic.crawler import HarmonicCrawler
+
+SAMPLE_HTML = """
+<html><body>
+<div class="company">
+  <h2 class="title">Acme AI</h2>
+  <p class="description">Robots for everyone.</p>
+  <a href="/companies/acme-ai">More</a>
+</div>
+<div class="company">
+  <h2 class="title">Widget Labs</h2>
+  <p class="description">Widgets as a service.</p>
+  <a href="https://widgetlabs.example.com">Site</a>
+</div>
+<div class="company"><p class="description">No title, skipped.</p></div>
+</body></html>
+"""
+
+
+class FakeResponse:
+    def __init__(self, status=200, body='', raise_timeout=False):
+        self.status = status
+        self._body = body
+        self._raise_timeout = raise_timeout
+
+    async def text(self):
+        return self._body
+
+    async def __aenter__(self):
+        if self._raise_timeout:
+            raise asyncio.TimeoutError
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    def __init__(self, response):
+        self._response = response
+        self.closed = False
+
+    def get(self, url, **kwargs):
+        return self._response
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def crawler(tmp_path, shared_session):
+    return HarmonicCrawler(output_dir=str(tmp_path), rate_limit=0, session=shared_session)
+
+
+async def test_start_close(tmp_path):
+    crawler = HarmonicCrawler(output_dir=str(tmp_path), rate_limit=0)
+    await crawler.start()
+    assert crawler.session is not None
+    await crawler.close()
+    assert crawler.session is None
+
+
+async def test_injected_session_not_closed(crawler, shared_session):
+    await crawler.start()
+    assert crawler.session is shared_session
+    await crawler.close()
+    assert not shared_session.closed
+
+
+async def test_context_manager(tmp_path):
+    async with HarmonicCrawler(output_dir=str(tmp_path), rate_limit=0) as crawler:
+        assert crawler.session is not None
+
+
+async def test_fetch_success(crawler):
+    crawler.session = FakeSession(FakeResponse(200, SAMPLE_HTML))
+    assert await crawler.fetch('https://harmonic.ai') == SAMPLE_HTML
+
+
+async def test_fetch_rate_limit(crawler):
+    crawler.session = FakeSession(FakeResponse(429))
+    assert await crawler.fetch('https://harmonic.ai') is None
+
+
+async def test_fetch_timeout(crawler):
+    crawler.session = FakeSession(FakeResponse(raise_timeout=True))
+    assert await crawler.fetch('https://harmonic.ai') is None
+
+
+async def test_crawl(crawler):
+    crawler.session = FakeSession(FakeResponse(200, SAMPLE_HTML))
+    await crawler.crawl(['https://harmonic.ai/startups'])
+    assert len(crawler.data) == 2
+    assert crawler.data[0]['title'] == 'Acme AI'
+
+
+def test_parse_page(crawler):
+    items = crawler.parse_page(SAMPLE_HTML, 'https://harmonic.ai/startups')
+    assert len(items) == 2
+    assert items[0]['title'] == 'Acme AI'
+    assert items[0]['description'] == 'Robots for everyone.'
+    assert items[0]['link'] == 'https://harmonic.ai/companies/acme-ai'
+    assert items[1]['link'] == 'https://widgetlabs.example.com'
+
+
+def test_extract_text(crawler):
+    from bs4 import BeautifulSoup
+    card = BeautifulSoup(SAMPLE_HTML, 'html.parser').select_one('div.company')
+    assert crawler._extract_text(card, 'h2.title') == 'Acme AI'
+    assert crawler._extract_text(card, 'h3.missing') == ''
+
+
+def test_extract_link(crawler):
+    from bs4 import BeautifulSoup
+    card = BeautifulSoup(SAMPLE_HTML, 'html.parser').select_one('div.company')
+    assert crawler._extract_link(card, 'https://harmonic.ai') == 'https://harmonic.ai/companies/acme-ai'
+
+
+def test_save_json(crawler, tmp_path):
+    crawler.data = [{'title': 'Acme AI', 'link': 'x'}]
+    path = crawler.save_json('out.json')
+    assert path.exists()
+    import json
+    assert json.loads(path.read_text())[0]['title'] == 'Acme AI'
+
+
+def test_save_csv(crawler, tmp_path):
+    crawler.data = [{'title': 'Acme AI', 'link': 'x'}, {'title': 'Widget Labs', 'extra': 'y'}]
+    path = crawler.save_csv('out.csv')
+    content = path.read_text()
+    assert 'title' in content.splitlines()[0]
+    assert 'Widget Labs' in content
+
+
+def test_save_csv_empty(crawler):
+    path = crawler.save_csv('empty.csv')
+    assert path.exists()
+    assert path.read_text() == ''
+
+
+async def test_crawl_with_sink(tmp_path):
+    import json
+    from crawlers.harmonic.crawler import jsonl_sink
+
+    out = tmp_path / 'items.jsonl'
+    sink = jsonl_sink(out)
+    crawler = HarmonicCrawler(output_dir=str(tmp_path), rate_limit=0, sink=sink)
+    crawler.session = FakeSession(FakeResponse(200, SAMPLE_HTML))
+    await crawler.crawl(['https://harmonic.ai/startups'])
+    sink.close()
+    assert crawler.data == []
+    lines = out.read_text().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])['title'] == 'Acme AI'
+
+
+async def test_shared_browser_extract(browser_context):
+    """The in-browser Crunchbase extractor runs against static HTML."""
+    from crawlers.crunchbase.crunchbase_profile import _EXTRACT_JS
+
+    page = await browser_context.new_page()
+    await page.set_content("""
+        <h1> Jane Doe </h1>
+        <div class="description">Investor and founder.</div>
+        <a href="https://linkedin.com/in/janedoe">in</a>
+        <a href="https://linkedin.com/in/janedoe">dup</a>
+        <a href="https://example.com" class="social-x">site</a>
+    """)
+    await page.evaluate(_EXTRACT_JS)
+    data = await page.evaluate('__extractProfile()')
+    assert data['name'] == 'Jane Doe'
+    assert data['overview'] == 'Investor and founder.'
+    urls = [l['url'] for l in data['links']]
+    assert urls.count('https://linkedin.com/in/janedoe') == 1
+    types = {l['url']: l['type'] for l in data['links']}
+    assert types['https://linkedin.com/in/janedoe'] == 'linkedin'